@@ -0,0 +1,68 @@
+"""
+MSN Range Gate Kernel
+
+Evaluates the MSN range constraints of all ADs against a whole fleet at
+once. Compiled with Numba when it is installed, otherwise computed with
+NumPy broadcasting.
+"""
+
+from typing import Any, Callable, Dict
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional: falls back to NumPy broadcasting
+    njit = None
+    prange = range
+
+# Error model used unless the caller asks for another; "numpy" skips
+# Python-style exception checks in the generated code
+DEFAULT_ERROR_MODEL = "numpy"
+
+# Compiled kernels by error model, built on first use
+_numba_kernels: Dict[str, Callable[..., Any]] = {}
+
+
+def _msn_gate_numpy(msns: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    return (msns[:, None] >= lo[None, :]) & (msns[:, None] <= hi[None, :])
+
+
+def _msn_gate_loops(msns, lo, hi):
+    out = np.empty((msns.size, lo.size), np.bool_)
+    for i in prange(msns.size):
+        for j in range(lo.size):
+            out[i, j] = msns[i] >= lo[j] and msns[i] <= hi[j]
+    return out
+
+
+def _numba_kernel(error_model: str) -> Callable[..., Any]:
+    """Compile _msn_gate_loops() for the given error model, once per process"""
+    kernel = _numba_kernels.get(error_model)
+    if kernel is None:
+        # Numba's on-disk cache is not keyed by compile options, so only
+        # the default error model is cached across runs
+        kernel = njit(parallel=True, boundscheck=False, error_model=error_model,
+                      cache=error_model == DEFAULT_ERROR_MODEL)(_msn_gate_loops)
+        _numba_kernels[error_model] = kernel
+    return kernel
+
+
+def msn_gate(msns: np.ndarray, lo: np.ndarray, hi: np.ndarray,
+             error_model: str = DEFAULT_ERROR_MODEL) -> np.ndarray:
+    """
+    Check every MSN against every AD's MSN bounds
+    
+    Args:
+        msns: int64 array of fleet MSNs, shape (F,)
+        lo: int64 array of per-AD minimum MSNs, shape (A,)
+        hi: int64 array of per-AD maximum MSNs, shape (A,)
+        error_model: Numba error model for the compiled kernel, "numpy"
+            or "python"; ignored without Numba
+    
+    Returns:
+        Boolean array of shape (F, A), True where lo[j] <= msns[i] <= hi[j]
+    """
+    if njit is not None:
+        return _numba_kernel(error_model)(msns, lo, hi)
+    return _msn_gate_numpy(msns, lo, hi)
@@ -6,17 +6,475 @@ against AD applicability rules and determine compliance status.
 """
 
 import json
-from typing import List, Dict, Tuple
+import math
+import multiprocessing
+import os
+import re
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import List, Dict, Tuple, Callable, Optional, Any, NamedTuple, Sequence
 from pathlib import Path
+from pydantic import ConfigDict, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the standard json module
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional: falls back to per-constraint substring checks
+    ahocorasick = None
+
+try:
+    import numpy as np
+except ImportError:  # optional: evaluate_fleet_vectorized falls back to evaluate_fleet
+    np = None
+
 from ad_compliance_schema import (
     AirworthinessDirective,
     AircraftConfiguration,
     ComplianceResult,
     MSNConstraint,
+    MSNConstraintType,
     ModificationConstraint
 )
 
 
+# Validators for whole lists at the parse boundaries, built once on first use
+_AD_LIST_ADAPTER = TypeAdapter(List[AirworthinessDirective], config=ConfigDict(defer_build=True))
+_AIRCRAFT_LIST_ADAPTER = TypeAdapter(List[AircraftConfiguration], config=ConfigDict(defer_build=True))
+
+
+def parse_fleet(fleet_data: List[Dict[str, Any]]) -> List[AircraftConfiguration]:
+    """
+    Validate a list of aircraft configuration dicts in one pass
+    
+    Args:
+        fleet_data: Dicts with AircraftConfiguration fields, e.g. parsed JSON
+    
+    Returns:
+        List of AircraftConfigurations
+    """
+    return _AIRCRAFT_LIST_ADAPTER.validate_python(fleet_data)
+
+
+def _lower_modifications(aircraft: AircraftConfiguration) -> Tuple[str, ...]:
+    """Lowercase and strip an aircraft's modifications for matching"""
+    return tuple(m.lower().strip() for m in aircraft.modifications)
+
+
+class _AircraftSnapshot(NamedTuple):
+    """Aircraft fields an evaluation and its deferred reason need, taken once per aircraft"""
+    aircraft_model: str
+    msn: int
+    modifications: Tuple[str, ...]
+    mods_lc: Tuple[str, ...]
+
+
+def _snapshot(aircraft: AircraftConfiguration, aircraft_mods_lc: Optional[Tuple[str, ...]] = None) -> _AircraftSnapshot:
+    """Take a snapshot of an aircraft, lowercasing its modifications unless already done"""
+    if aircraft_mods_lc is None:
+        aircraft_mods_lc = _lower_modifications(aircraft)
+    return _AircraftSnapshot(aircraft.aircraft_model, aircraft.msn, tuple(aircraft.modifications), aircraft_mods_lc)
+
+
+def _mod_tokens(constraint: ModificationConstraint) -> Tuple[str, ...]:
+    """Lowercased identifier and aliases of a modification constraint"""
+    return (constraint.mod_id.lower(), *(alias.lower() for alias in constraint.aliases))
+
+
+def _token_pattern(tokens: Sequence[str]) -> re.Pattern:
+    """Compile one pattern matching any of the given lowercased identifiers as a substring"""
+    return re.compile("|".join(re.escape(token) for token in tokens))
+
+
+def _build_automaton(token_groups: Sequence[Tuple[str, ...]]) -> Optional[Any]:
+    """
+    Build an Aho-Corasick automaton over the identifiers of a list of constraints
+    
+    Each identifier maps to the indices of the constraints it belongs to.
+    
+    Args:
+        token_groups: Lowercased identifiers of each constraint, see _mod_tokens()
+    
+    Returns:
+        Automaton, or None if pyahocorasick is unavailable, there are no
+        constraints, or an identifier is empty
+    """
+    if ahocorasick is None or not token_groups:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for idx, tokens in enumerate(token_groups):
+        for token in tokens:
+            if not token:
+                return None
+            automaton.add_word(token, automaton.get(token, ()) + (idx,))
+    automaton.make_automaton()
+    return automaton
+
+
+def _first_match(automaton: Any, aircraft_mods_lc: Tuple[str, ...]) -> Optional[Tuple[int, int]]:
+    """
+    Scan aircraft modifications once with a constraint automaton
+    
+    Returns:
+        (constraint index, modification index) of the first constraint, in
+        rule order, matched by any modification, or None if nothing matches
+    """
+    best = None
+    for pos, mod_lc in enumerate(aircraft_mods_lc):
+        for _, indices in automaton.iter(mod_lc):
+            for idx in indices:
+                if best is None or idx < best[0]:
+                    best = (idx, pos)
+    return best
+
+
+def _any_match(automaton: Any, aircraft_mods_lc: Tuple[str, ...]) -> bool:
+    """Check whether any aircraft modification matches a constraint automaton"""
+    for mod_lc in aircraft_mods_lc:
+        for _ in automaton.iter(mod_lc):
+            return True
+    return False
+
+
+# Stage at which evaluation of an (aircraft, AD) pair stopped
+STAGE_MODEL = 0       # aircraft model not affected
+STAGE_MSN = 1         # MSN outside the constraints
+STAGE_EXCLUDED = 2    # has an excluded modification
+STAGE_REQUIRED = 3    # lacks all required modifications
+STAGE_AFFECTED = 4    # all checks passed
+
+# Range of MSNs representable in the int64 arrays used by msn_gate(), also
+# standing in there for a missing min_msn/max_msn
+_MSN_MIN = -(2 ** 63)
+_MSN_MAX = 2 ** 63 - 1
+
+# Reasons for stages whose AD has no constraints to check, and for a model
+# that is not affected
+_NO_MSN_CONSTRAINTS = "No MSN constraints specified"
+_NO_EXCLUDED_MODS = "No excluded modifications specified"
+_NO_REQUIRED_MODS = "No required modifications specified"
+_MODEL_NOT_AFFECTED = "Aircraft model '{}' is not in the affected models list"
+_MODEL_CHECK_FAILED_REASON = "Model check: " + _MODEL_NOT_AFFECTED
+_SKIPPED_MSN_REASON = "MSN check: " + _NO_MSN_CONSTRAINTS
+_SKIPPED_EXCLUDED_REASON = "Excluded mods check: " + _NO_EXCLUDED_MODS
+_SKIPPED_REQUIRED_REASON = "Required mods check: " + _NO_REQUIRED_MODS
+
+# (is_affected, status) for each stage
+_STAGE_OUTCOMES = (
+    (False, "not applicable"),
+    (False, "not applicable"),
+    (False, "no"),
+    (False, "no"),
+    (True, "yes"),
+)
+
+
+def _union_pattern(token_groups: Sequence[Tuple[str, ...]]) -> re.Pattern:
+    """
+    Compile one pattern matching any identifier of the given constraints
+    
+    Only tells whether some constraint matched; which one is decided by the
+    per-constraint checks, since alternation can hide overlapping matches.
+    """
+    return _token_pattern([token for tokens in token_groups for token in tokens])
+
+
+# Distinct modification sets memoized per AD by the generated stage functions
+MODS_STAGE_CACHE_SIZE = 4096
+
+
+def _generate_stage_fn(ad: AirworthinessDirective, models: frozenset, msn_set: frozenset = frozenset(),
+                       excl_tokens: Sequence[Tuple[str, ...]] = (), req_tokens: Sequence[Tuple[str, ...]] = (),
+                       excl_automaton: Optional[Any] = None,
+                       req_automaton: Optional[Any] = None) -> Callable[[str, int, Tuple[str, ...]], int]:
+    """
+    Generate a specialized evaluation function for a single AD
+    
+    The applicability rules are inlined into the generated source as
+    constants, and stages without constraints are left out entirely. The
+    generated function only decides the outcome; reasons are produced
+    separately by the step-by-step checks on the engine. The modification
+    checks are memoized on the aircraft's lowercased modifications, see
+    MODS_STAGE_CACHE_SIZE.
+    
+    Args:
+        ad: Directive to compile
+        models: Affected aircraft models as a set, shared with the engine
+        msn_set: MSNs of a list constraint as a set, shared with the engine
+        excl_tokens: Lowercased identifiers of each excluded modification
+        req_tokens: Lowercased identifiers of each required modification
+        excl_automaton: Automaton over the excluded modifications, if built
+        req_automaton: Automaton over the required modifications, if built
+    
+    Returns:
+        Function taking an aircraft model, MSN and lowercased, stripped
+        modifications and returning the stage at which evaluation stopped
+    """
+    rules = ad.applicability_rules
+    
+    src = []
+    
+    # Steps 3 and 4 only depend on the modifications, so they go in a
+    # separate function memoized on them; a fleet repeats a handful of
+    # modification sets across many aircraft
+    mods_src = []
+    
+    # Step 3: Excluded modifications
+    if excl_automaton is not None:
+        mods_src += [
+            "    if _any_match(_EXCL_AC, mods_lc):",
+            f"        return {STAGE_EXCLUDED}",
+        ]
+    elif excl_tokens:
+        mods_src += [
+            "    for mod_lower in mods_lc:",
+            "        if _EXCL_RE.search(mod_lower):",
+            f"            return {STAGE_EXCLUDED}",
+        ]
+    
+    # Step 4: Required modifications
+    if req_automaton is not None:
+        mods_src.append(f"    return {STAGE_AFFECTED} if _any_match(_REQ_AC, mods_lc) else {STAGE_REQUIRED}")
+    elif req_tokens:
+        mods_src += [
+            "    for mod_lower in mods_lc:",
+            "        if _REQ_RE.search(mod_lower):",
+            f"            return {STAGE_AFFECTED}",
+            f"    return {STAGE_REQUIRED}",
+        ]
+    elif mods_src:
+        mods_src.append(f"    return {STAGE_AFFECTED}")
+    
+    if mods_src:
+        # Keyed on the lowercased modifications as given; the cached value
+        # is a stage, so every call still builds its own result
+        src += [
+            f"@_lru_cache(maxsize={MODS_STAGE_CACHE_SIZE})",
+            "def _mods_stage(mods_lc, _EXCL_AC=_EXCL_AC, _EXCL_RE=_EXCL_RE, _REQ_AC=_REQ_AC, _REQ_RE=_REQ_RE,",
+            "                _any_match=_any_match):",
+            *mods_src,
+            "",
+        ]
+    else:
+        src.append("_mods_stage = None")
+    
+    src += [
+        "def _stage(model, msn, mods_lc, _MODELS=_MODELS, _MSNS=_MSNS, _mods_stage=_mods_stage):",
+        "    if model not in _MODELS:",
+        f"        return {STAGE_MODEL}",
+    ]
+    
+    # Step 2: MSN constraints
+    msn_constraints = rules.msn_constraints
+    msn_fails = []
+    if msn_constraints is not None:
+        if msn_constraints.type == MSNConstraintType.RANGE:
+            if msn_constraints.min_msn is not None:
+                msn_fails.append(f"msn < {msn_constraints.min_msn!r}")
+            if msn_constraints.max_msn is not None:
+                msn_fails.append(f"msn > {msn_constraints.max_msn!r}")
+        elif msn_constraints.type == MSNConstraintType.LIST:
+            msn_fails.append("msn not in _MSNS")
+    if msn_fails:
+        src += [
+            f"    if {' or '.join(msn_fails)}:",
+            f"        return {STAGE_MSN}",
+        ]
+    
+    src.append("    return _mods_stage(mods_lc)" if mods_src else f"    return {STAGE_AFFECTED}")
+    
+    namespace = {
+        "_MODELS": models,
+        "_MSNS": msn_set,
+        "_EXCL_AC": excl_automaton,
+        "_EXCL_RE": _union_pattern(excl_tokens) if excl_automaton is None else None,
+        "_REQ_AC": req_automaton,
+        "_REQ_RE": _union_pattern(req_tokens) if req_automaton is None else None,
+        "_any_match": _any_match,
+        "_lru_cache": lru_cache,
+    }
+    exec(compile("\n".join(src), f"<ad:{ad.ad_id}>", "exec"), namespace)
+    return namespace["_stage"]
+
+
+class CompiledAD(NamedTuple):
+    """
+    Flattened, precompiled view of an AD used on the evaluation hot path
+    
+    The AirworthinessDirective itself is kept for reasons and serialization.
+    """
+    ad: AirworthinessDirective
+    ad_id: str
+    models_set: frozenset
+    msn_set: frozenset
+    msn_match_fn: Optional[Callable[[int], bool]]
+    # (mod_id, pattern over its lowercased identifiers) per constraint, in rule order
+    excl_mods: Tuple[Tuple[str, re.Pattern], ...]
+    req_mods: Tuple[Tuple[str, re.Pattern], ...]
+    excl_automaton: Optional[Any]
+    req_automaton: Optional[Any]
+    has_msn: bool
+    has_excl: bool
+    has_req: bool
+    stage_fn: Callable[[str, int, Tuple[str, ...]], int]
+
+
+def _msn_matcher(msn_constraints: MSNConstraint, msn_set: frozenset) -> Callable[[int], bool]:
+    """MSN matcher with the constraint's bounds and list fixed at compile time, see MSNConstraint.matches()"""
+    if msn_constraints.type == MSNConstraintType.ALL:
+        return lambda msn: True
+    elif msn_constraints.type == MSNConstraintType.RANGE:
+        min_msn, max_msn = msn_constraints.min_msn, msn_constraints.max_msn
+        return lambda msn: (min_msn is None or msn >= min_msn) and (max_msn is None or msn <= max_msn)
+    elif msn_constraints.type == MSNConstraintType.LIST:
+        return msn_set.__contains__
+    return lambda msn: False
+
+
+def _compile_ad(ad: AirworthinessDirective) -> CompiledAD:
+    """
+    Precompute everything needed to evaluate aircraft against an AD
+    
+    Derived state lives here rather than on the schema models, which stay
+    mutable; an AD changed after compiling must be compiled again.
+    """
+    rules = ad.applicability_rules
+    models_set = frozenset(rules.aircraft_models)
+    msn_constraints = rules.msn_constraints
+    msn_set = frozenset(msn_constraints.msn_list or ()) if msn_constraints is not None else frozenset()
+    excl_tokens = [_mod_tokens(c) for c in rules.excluded_if_modifications]
+    req_tokens = [_mod_tokens(c) for c in rules.required_modifications]
+    excl_automaton = _build_automaton(excl_tokens)
+    req_automaton = _build_automaton(req_tokens)
+    return CompiledAD(
+        ad=ad,
+        ad_id=ad.ad_id,
+        models_set=models_set,
+        msn_set=msn_set,
+        msn_match_fn=_msn_matcher(msn_constraints, msn_set) if msn_constraints is not None else None,
+        excl_mods=tuple((c.mod_id, _token_pattern(tokens)) for c, tokens in zip(rules.excluded_if_modifications, excl_tokens)),
+        req_mods=tuple((c.mod_id, _token_pattern(tokens)) for c, tokens in zip(rules.required_modifications, req_tokens)),
+        excl_automaton=excl_automaton,
+        req_automaton=req_automaton,
+        has_msn=msn_constraints is not None,
+        has_excl=bool(excl_tokens),
+        has_req=bool(req_tokens),
+        stage_fn=_generate_stage_fn(ad, models_set, msn_set, excl_tokens, req_tokens, excl_automaton, req_automaton),
+    )
+
+
+def _check_aircraft_model(compiled: CompiledAD, aircraft_model: str) -> Tuple[bool, str]:
+    """Model check against a compiled AD, see ADComplianceEngine.check_aircraft_model()"""
+    if aircraft_model not in compiled.models_set:
+        return False, _MODEL_NOT_AFFECTED.format(aircraft_model)
+    return True, f"Aircraft model '{aircraft_model}' is in the affected models list"
+
+
+def _check_msn_constraints(compiled: CompiledAD, msn: int) -> Tuple[bool, str]:
+    """MSN check against a compiled AD, see ADComplianceEngine.check_msn_constraints()"""
+    if not compiled.has_msn:
+        return True, _NO_MSN_CONSTRAINTS
+    
+    if compiled.msn_match_fn(msn):
+        return True, f"MSN {msn} meets the constraints"
+    else:
+        return False, f"MSN {msn} does not meet the constraints"
+
+
+def _check_excluded_modifications(compiled: CompiledAD, modifications: Sequence[str],
+                                  aircraft_mods_lc: Tuple[str, ...]) -> Tuple[bool, str]:
+    """Excluded mods check against a compiled AD, see ADComplianceEngine.check_excluded_modifications()"""
+    if not compiled.has_excl:
+        return False, _NO_EXCLUDED_MODS
+    
+    if compiled.excl_automaton is not None:
+        hit = _first_match(compiled.excl_automaton, aircraft_mods_lc)
+        if hit is not None:
+            return True, f"Aircraft has excluded modification: {compiled.excl_mods[hit[0]][0]} (matched: {modifications[hit[1]]})"
+        return False, "Aircraft does not have any excluded modifications"
+    
+    for mod_id, pattern in compiled.excl_mods:
+        for aircraft_mod, mod_lc in zip(modifications, aircraft_mods_lc):
+            if pattern.search(mod_lc):
+                return True, f"Aircraft has excluded modification: {mod_id} (matched: {aircraft_mod})"
+    
+    return False, "Aircraft does not have any excluded modifications"
+
+
+def _check_required_modifications(compiled: CompiledAD, aircraft_mods_lc: Tuple[str, ...]) -> Tuple[bool, str]:
+    """Required mods check against a compiled AD, see ADComplianceEngine.check_required_modifications()"""
+    if not compiled.has_req:
+        return True, _NO_REQUIRED_MODS
+    
+    if compiled.req_automaton is not None:
+        hit = _first_match(compiled.req_automaton, aircraft_mods_lc)
+        if hit is not None:
+            return True, f"Aircraft has required modification: {compiled.req_mods[hit[0]][0]}"
+        return False, "Aircraft does not have any of the required modifications"
+    
+    for mod_id, pattern in compiled.req_mods:
+        for mod_lc in aircraft_mods_lc:
+            if pattern.search(mod_lc):
+                return True, f"Aircraft has required modification: {mod_id}"
+    
+    return False, "Aircraft does not have any of the required modifications"
+
+
+def _format_reason(compiled: CompiledAD, stage: int, aircraft: _AircraftSnapshot) -> str:
+    """
+    Build the step-by-step reasoning for an evaluation that stopped at the given stage
+    
+    Only called when a result's reason is first read. Stages the AD has
+    no constraints for use their fixed reason without running the check.
+    """
+    reasons = [f"Model check: {_check_aircraft_model(compiled, aircraft.aircraft_model)[1]}"]
+    if stage >= STAGE_MSN:
+        if compiled.has_msn:
+            reasons.append(f"MSN check: {_check_msn_constraints(compiled, aircraft.msn)[1]}")
+        else:
+            reasons.append(_SKIPPED_MSN_REASON)
+    if stage >= STAGE_EXCLUDED:
+        if compiled.has_excl:
+            reasons.append(f"Excluded mods check: {_check_excluded_modifications(compiled, aircraft.modifications, aircraft.mods_lc)[1]}")
+        else:
+            reasons.append(_SKIPPED_EXCLUDED_REASON)
+    if stage >= STAGE_REQUIRED:
+        if compiled.has_req:
+            reasons.append(f"Required mods check: {_check_required_modifications(compiled, aircraft.mods_lc)[1]}")
+        else:
+            reasons.append(_SKIPPED_REQUIRED_REASON)
+    return "; ".join(reasons)
+
+
+def _make_result(aircraft: _AircraftSnapshot, compiled: CompiledAD, stage: int,
+                 collect_reasons: bool = True) -> ComplianceResult:
+    """
+    Build the ComplianceResult for an evaluation that stopped at the given stage
+    
+    The deferred reason captures the compiled AD and the aircraft snapshot,
+    so it matches the status even if the engine loads other rules or the
+    aircraft is modified before the reason is read.
+    """
+    is_affected, status = _STAGE_OUTCOMES[stage]
+    reason = reason_fn = None
+    if collect_reasons:
+        if stage == STAGE_MODEL:
+            # Most pairs in a mixed fleet stop here, and this reason is
+            # cheaper to build than to defer
+            reason = _MODEL_CHECK_FAILED_REASON.format(aircraft.aircraft_model)
+        else:
+            reason_fn = partial(_format_reason, compiled, stage, aircraft)
+    # Positional arguments: this runs once per (aircraft, AD) pair
+    return ComplianceResult(compiled.ad_id, aircraft.aircraft_model, aircraft.msn, is_affected, status,
+                            reason, reason_fn)
+
+
 class ADComplianceEngine:
     """
     Engine for evaluating aircraft configurations against AD rules
@@ -29,36 +487,141 @@ class ADComplianceEngine:
         Args:
             ad_rules_path: Path to JSON file containing AD rules
         """
-        self.ads: List[AirworthinessDirective] = []
+        self._reset()
         self.load_rules(ad_rules_path)
     
+    def __getstate__(self) -> Dict[str, Any]:
+        # Generated stage functions cannot be pickled, so only the ADs are
+        # sent and everything derived from them is rebuilt on unpickling
+        return {"ads": self.ads}
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        self._reset()
+        self._add_ads(state["ads"])
+    
+    def _reset(self):
+        """Start with no ADs loaded"""
+        self.ads: List[AirworthinessDirective] = []
+        # Parallel to self.ads, and indexed by ad_id
+        self._compiled_ads: List[CompiledAD] = []
+        self._compiled: Dict[str, CompiledAD] = {}
+        # Aircraft model -> indices into self.ads of the ADs listing it
+        self._ads_by_model: Dict[str, frozenset] = {}
+        # MSN index over self.ads, see _build_msn_index()
+        self._msn_unconstrained: List[int] = []
+        self._msn_list_index: Dict[int, List[int]] = {}
+        self._msn_ranges: List[Tuple[float, float, int]] = []
+        self._msn_range_mins: List[float] = []
+        # Per-AD MSN bounds for msn_gate(), full range unless a range constraint
+        # applies; None without NumPy or if a bound does not fit in int64
+        self._msn_lo: Any = None
+        self._msn_hi: Any = None
+    
     def load_rules(self, rules_path: str):
         """Load AD rules from JSON file"""
-        with open(rules_path, 'r') as f:
-            rules_data = json.load(f)
-        
-        for ad_data in rules_data:
-            # Convert modification dicts to ModificationConstraint objects
-            if 'excluded_if_modifications' in ad_data['applicability_rules']:
-                ad_data['applicability_rules']['excluded_if_modifications'] = [
-                    ModificationConstraint(**mod) 
-                    for mod in ad_data['applicability_rules']['excluded_if_modifications']
-                ]
-            
-            if 'required_modifications' in ad_data['applicability_rules']:
-                ad_data['applicability_rules']['required_modifications'] = [
-                    ModificationConstraint(**mod)
-                    for mod in ad_data['applicability_rules']['required_modifications']
-                ]
-            
-            # Convert MSN constraints
-            if 'msn_constraints' in ad_data['applicability_rules'] and ad_data['applicability_rules']['msn_constraints']:
-                ad_data['applicability_rules']['msn_constraints'] = MSNConstraint(
-                    **ad_data['applicability_rules']['msn_constraints']
-                )
-            
-            ad = AirworthinessDirective(**ad_data)
+        raw = Path(rules_path).read_bytes()
+        rules_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        
+        # Nested constraint dicts are converted by Pydantic in the same pass
+        self._add_ads(_AD_LIST_ADAPTER.validate_python(rules_data))
+    
+    def _add_ads(self, ads: List[AirworthinessDirective]):
+        """
+        Compile and index additional ADs
+        
+        Raises:
+            ValueError: If an AD ID is already loaded or appears twice
+        """
+        # Results and the per-AD dicts are keyed by AD ID, so IDs must be unique
+        seen = set(self._compiled)
+        for ad in ads:
+            if ad.ad_id in seen:
+                raise ValueError(f"Duplicate AD ID: {ad.ad_id}")
+            seen.add(ad.ad_id)
+        
+        for ad in ads:
+            compiled = _compile_ad(ad)
             self.ads.append(ad)
+            self._compiled_ads.append(compiled)
+            self._compiled[ad.ad_id] = compiled
+        
+        self._build_model_index()
+        self._build_msn_index()
+    
+    def _build_model_index(self):
+        """Index all loaded ADs by the aircraft models they list"""
+        ads_by_model: Dict[str, List[int]] = defaultdict(list)
+        for i, ad in enumerate(self.ads):
+            for model in ad.applicability_rules.aircraft_models:
+                ads_by_model[model].append(i)
+        self._ads_by_model = {model: frozenset(indices) for model, indices in ads_by_model.items()}
+    
+    def _build_msn_index(self):
+        """
+        Index all loaded ADs by their MSN constraints
+        
+        Range constraints become (min_msn, max_msn, ad_index) rows sorted by
+        min_msn; list constraints map each MSN to its AD indices; ADs without
+        a constraint are always candidates. When NumPy is available, per-AD
+        int64 bounds are also built for msn_gate(), unless a bound does not
+        fit in int64.
+        """
+        unconstrained = []
+        list_index: Dict[int, List[int]] = {}
+        ranges = []
+        for i, ad in enumerate(self.ads):
+            msn_constraints = ad.applicability_rules.msn_constraints
+            if msn_constraints is None or msn_constraints.type == MSNConstraintType.ALL:
+                unconstrained.append(i)
+            elif msn_constraints.type == MSNConstraintType.LIST:
+                for msn in self._compiled_ads[i].msn_set:
+                    list_index.setdefault(msn, []).append(i)
+            elif msn_constraints.type == MSNConstraintType.RANGE:
+                ranges.append((
+                    msn_constraints.min_msn if msn_constraints.min_msn is not None else -math.inf,
+                    msn_constraints.max_msn if msn_constraints.max_msn is not None else math.inf,
+                    i,
+                ))
+        ranges.sort()
+        
+        self._msn_unconstrained = unconstrained
+        self._msn_list_index = list_index
+        self._msn_range_mins = [lo for lo, _, _ in ranges]
+        self._msn_ranges = ranges
+        
+        self._msn_lo = self._msn_hi = None
+        if np is not None and all(_MSN_MIN <= bound <= _MSN_MAX for lo, hi, _ in ranges
+                                  for bound in (lo, hi) if not math.isinf(bound)):
+            self._msn_lo = np.full(len(self.ads), _MSN_MIN, dtype=np.int64)
+            self._msn_hi = np.full(len(self.ads), _MSN_MAX, dtype=np.int64)
+            for lo, hi, i in ranges:
+                if not math.isinf(lo):
+                    self._msn_lo[i] = lo
+                if not math.isinf(hi):
+                    self._msn_hi[i] = hi
+    
+    def applicable_ad_indices(self, msn: int) -> List[int]:
+        """
+        Find the ADs whose MSN constraints admit the given MSN
+        
+        Range constraints are searched by binary search on min_msn rather
+        than tested one by one.
+        
+        Returns:
+            Sorted indices into self.ads
+        """
+        candidates = self._msn_unconstrained + self._msn_list_index.get(msn, [])
+        head = self._msn_ranges[:bisect_right(self._msn_range_mins, msn)]
+        candidates += [i for _, hi, i in head if hi >= msn]
+        candidates.sort()
+        return candidates
+    
+    def _compiled_for(self, ad: AirworthinessDirective) -> CompiledAD:
+        """Compiled form of an AD: the loaded one if this is that AD, otherwise compiled on the spot"""
+        compiled = self._compiled.get(ad.ad_id)
+        if compiled is None or compiled.ad is not ad:
+            compiled = _compile_ad(ad)
+        return compiled
     
     def check_aircraft_model(self, aircraft: AircraftConfiguration, ad: AirworthinessDirective) -> Tuple[bool, str]:
         """
@@ -67,9 +630,7 @@ class ADComplianceEngine:
         Returns:
             (matches: bool, reason: str)
         """
-        if aircraft.aircraft_model not in ad.applicability_rules.aircraft_models:
-            return False, f"Aircraft model '{aircraft.aircraft_model}' is not in the affected models list"
-        return True, f"Aircraft model '{aircraft.aircraft_model}' is in the affected models list"
+        return _check_aircraft_model(self._compiled_for(ad), aircraft.aircraft_model)
     
     def check_msn_constraints(self, aircraft: AircraftConfiguration, ad: AirworthinessDirective) -> Tuple[bool, str]:
         """
@@ -78,150 +639,236 @@ class ADComplianceEngine:
         Returns:
             (matches: bool, reason: str)
         """
-        if ad.applicability_rules.msn_constraints is None:
-            return True, "No MSN constraints specified"
-        
-        if ad.applicability_rules.msn_constraints.matches(aircraft.msn):
-            return True, f"MSN {aircraft.msn} meets the constraints"
-        else:
-            return False, f"MSN {aircraft.msn} does not meet the constraints"
+        return _check_msn_constraints(self._compiled_for(ad), aircraft.msn)
     
-    def check_excluded_modifications(self, aircraft: AircraftConfiguration, ad: AirworthinessDirective) -> Tuple[bool, str]:
+    def check_excluded_modifications(self, aircraft: AircraftConfiguration, ad: AirworthinessDirective,
+                                     aircraft_mods_lc: Optional[Tuple[str, ...]] = None) -> Tuple[bool, str]:
         """
         Check if aircraft has any modifications that exclude it from AD
         
+        Args:
+            aircraft_mods_lc: Aircraft modifications already lowercased and
+                stripped; computed from the aircraft if not given
+        
         Returns:
             (is_excluded: bool, reason: str)
         """
-        for excluded_mod in ad.applicability_rules.excluded_if_modifications:
-            for aircraft_mod in aircraft.modifications:
-                if excluded_mod.matches(aircraft_mod):
-                    return True, f"Aircraft has excluded modification: {excluded_mod.mod_id} (matched: {aircraft_mod})"
-        
-        if ad.applicability_rules.excluded_if_modifications:
-            return False, "Aircraft does not have any excluded modifications"
-        return False, "No excluded modifications specified"
+        if aircraft_mods_lc is None:
+            aircraft_mods_lc = _lower_modifications(aircraft)
+        return _check_excluded_modifications(self._compiled_for(ad), aircraft.modifications, aircraft_mods_lc)
     
-    def check_required_modifications(self, aircraft: AircraftConfiguration, ad: AirworthinessDirective) -> Tuple[bool, str]:
+    def check_required_modifications(self, aircraft: AircraftConfiguration, ad: AirworthinessDirective,
+                                     aircraft_mods_lc: Optional[Tuple[str, ...]] = None) -> Tuple[bool, str]:
         """
         Check if aircraft has required modifications for AD to apply
         
+        Args:
+            aircraft_mods_lc: Aircraft modifications already lowercased and
+                stripped; computed from the aircraft if not given
+        
         Returns:
             (has_required: bool, reason: str)
         """
-        if not ad.applicability_rules.required_modifications:
-            return True, "No required modifications specified"
-        
-        for required_mod in ad.applicability_rules.required_modifications:
-            for aircraft_mod in aircraft.modifications:
-                if required_mod.matches(aircraft_mod):
-                    return True, f"Aircraft has required modification: {required_mod.mod_id}"
-        
-        return False, "Aircraft does not have any of the required modifications"
+        if aircraft_mods_lc is None:
+            aircraft_mods_lc = _lower_modifications(aircraft)
+        return _check_required_modifications(self._compiled_for(ad), aircraft_mods_lc)
+    
+    def _evaluate(self, aircraft: _AircraftSnapshot, compiled: CompiledAD,
+                  collect_reasons: bool = True) -> ComplianceResult:
+        """Evaluate a single aircraft snapshot against a compiled AD"""
+        stage = compiled.stage_fn(aircraft.aircraft_model, aircraft.msn, aircraft.mods_lc)
+        return _make_result(aircraft, compiled, stage, collect_reasons)
     
-    def evaluate(self, aircraft: AircraftConfiguration, ad: AirworthinessDirective) -> ComplianceResult:
+    def evaluate(self, aircraft: AircraftConfiguration, ad: AirworthinessDirective,
+                 aircraft_mods_lc: Optional[Tuple[str, ...]] = None, collect_reasons: bool = True) -> ComplianceResult:
         """
         Evaluate a single aircraft against a single AD
         
+        Args:
+            aircraft_mods_lc: Aircraft modifications already lowercased and
+                stripped; computed from the aircraft if not given
+            collect_reasons: If False, the result's reason is None
+        
         Returns:
-            ComplianceResult with status and detailed reasoning
+            ComplianceResult with status and detailed reasoning; the reasoning
+            is assembled on first access to ``reason``
         """
-        reasons = []
-        
-        # Step 1: Check aircraft model
-        model_matches, model_reason = self.check_aircraft_model(aircraft, ad)
-        reasons.append(f"Model check: {model_reason}")
-        
-        if not model_matches:
-            return ComplianceResult(
-                ad_id=ad.ad_id,
-                aircraft_model=aircraft.aircraft_model,
-                msn=aircraft.msn,
-                is_affected=False,
-                status="not applicable",
-                reason="; ".join(reasons)
-            )
-        
-        # Step 2: Check MSN constraints
-        msn_matches, msn_reason = self.check_msn_constraints(aircraft, ad)
-        reasons.append(f"MSN check: {msn_reason}")
-        
-        if not msn_matches:
-            return ComplianceResult(
-                ad_id=ad.ad_id,
-                aircraft_model=aircraft.aircraft_model,
-                msn=aircraft.msn,
-                is_affected=False,
-                status="not applicable",
-                reason="; ".join(reasons)
-            )
-        
-        # Step 3: Check excluded modifications
-        is_excluded, excluded_reason = self.check_excluded_modifications(aircraft, ad)
-        reasons.append(f"Excluded mods check: {excluded_reason}")
-        
-        if is_excluded:
-            return ComplianceResult(
-                ad_id=ad.ad_id,
-                aircraft_model=aircraft.aircraft_model,
-                msn=aircraft.msn,
-                is_affected=False,
-                status="no",
-                reason="; ".join(reasons)
-            )
-        
-        # Step 4: Check required modifications
-        has_required, required_reason = self.check_required_modifications(aircraft, ad)
-        reasons.append(f"Required mods check: {required_reason}")
-        
-        if not has_required:
-            return ComplianceResult(
-                ad_id=ad.ad_id,
-                aircraft_model=aircraft.aircraft_model,
-                msn=aircraft.msn,
-                is_affected=False,
-                status="no",
-                reason="; ".join(reasons)
-            )
-        
-        # All checks passed - aircraft IS affected by this AD
-        return ComplianceResult(
-            ad_id=ad.ad_id,
-            aircraft_model=aircraft.aircraft_model,
-            msn=aircraft.msn,
-            is_affected=True,
-            status="yes",
-            reason="; ".join(reasons)
-        )
-    
-    def evaluate_all(self, aircraft: AircraftConfiguration) -> List[ComplianceResult]:
+        return self._evaluate(_snapshot(aircraft, aircraft_mods_lc), self._compiled_for(ad), collect_reasons)
+    
+    def evaluate_all(self, aircraft: AircraftConfiguration, collect_reasons: bool = True) -> List[ComplianceResult]:
         """
         Evaluate a single aircraft against all loaded ADs
         
+        Args:
+            collect_reasons: If False, the results' reasons are None
+        
         Returns:
             List of ComplianceResults, one for each AD
         """
+        # Snapshot the aircraft and lowercase its modifications once for all ADs
+        snapshot = _snapshot(aircraft)
+        
+        # Only ADs listing this model whose MSN constraints admit this
+        # aircraft need a full evaluation; the rest stop at the model or MSN check
+        model_candidates = self._ads_by_model.get(aircraft.aircraft_model, frozenset())
+        if model_candidates:
+            candidates = model_candidates.intersection(self.applicable_ad_indices(aircraft.msn))
+        else:
+            candidates = model_candidates
+        
         results = []
-        for ad in self.ads:
-            result = self.evaluate(aircraft, ad)
+        for i, compiled in enumerate(self._compiled_ads):
+            if i in candidates:
+                result = self._evaluate(snapshot, compiled, collect_reasons)
+            else:
+                stage = STAGE_MSN if i in model_candidates else STAGE_MODEL
+                result = _make_result(snapshot, compiled, stage, collect_reasons)
             results.append(result)
         return results
     
-    def evaluate_fleet(self, fleet: List[AircraftConfiguration]) -> Dict[str, List[ComplianceResult]]:
+    def evaluate_all_dict(self, aircraft: AircraftConfiguration,
+                          collect_reasons: bool = True) -> Dict[str, ComplianceResult]:
+        """
+        Evaluate a single aircraft against all loaded ADs, indexed by AD
+        
+        Args:
+            collect_reasons: If False, the results' reasons are None
+        
+        Returns:
+            Dict mapping AD ID to ComplianceResult, in load order
+        """
+        return {r.ad_id: r for r in self.evaluate_all(aircraft, collect_reasons)}
+    
+    def evaluate_fleet(self, fleet: List[AircraftConfiguration],
+                       collect_reasons: bool = True) -> Dict[str, Dict[str, ComplianceResult]]:
         """
         Evaluate multiple aircraft against all loaded ADs
         
+        Args:
+            collect_reasons: If False, the results' reasons are None
+        
         Returns:
-            Dict mapping aircraft identifier to list of compliance results
+            Dict mapping aircraft identifier to a dict of compliance results
+            keyed by AD ID, in load order
         """
         fleet_results = {}
         for aircraft in fleet:
             aircraft_id = f"{aircraft.aircraft_model}-{aircraft.msn}"
-            fleet_results[aircraft_id] = self.evaluate_all(aircraft)
+            fleet_results[aircraft_id] = self.evaluate_all_dict(aircraft, collect_reasons)
+        return fleet_results
+    
+    def evaluate_fleet_vectorized(self, fleet: List[AircraftConfiguration], collect_reasons: bool = True,
+                                  error_model: str = "numpy") -> Dict[str, Dict[str, ComplianceResult]]:
+        """
+        Evaluate multiple aircraft against all loaded ADs, applying the model
+        and MSN checks to the whole fleet at once with NumPy
+        
+        Only aircraft that pass both checks for an AD go through the
+        modification checks. Falls back to evaluate_fleet() if NumPy is
+        not installed or an MSN range bound or fleet MSN does not fit in
+        int64.
+        
+        Args:
+            collect_reasons: If False, the results' reasons are None
+            error_model: Numba error model for the MSN range kernel, "numpy"
+                or "python", see msn_gate(); ignored without Numba
+        
+        Returns:
+            Dict mapping aircraft identifier to a dict of compliance results
+            keyed by AD ID, same as evaluate_fleet()
+        """
+        if self._msn_lo is None or not fleet:
+            return self.evaluate_fleet(fleet, collect_reasons)
+        
+        # Imported here so that only callers of this method load Numba
+        from _msn_gate import msn_gate
+        
+        try:
+            msns = np.fromiter((aircraft.msn for aircraft in fleet), dtype=np.int64, count=len(fleet))
+        except OverflowError:
+            # Some MSN does not fit in int64, so the array gates cannot be used
+            return self.evaluate_fleet(fleet, collect_reasons)
+        models = np.array([aircraft.aircraft_model for aircraft in fleet])
+        
+        # Range constraints of all ADs against the whole fleet in one call
+        range_gate = msn_gate(msns, self._msn_lo, self._msn_hi, error_model)
+        
+        # Per AD: which aircraft pass the model check, and which pass both checks
+        gates = []
+        for j, compiled in enumerate(self._compiled_ads):
+            model_mask = np.isin(models, np.array(list(compiled.models_set)))
+            live_mask = model_mask & range_gate[:, j]
+            if compiled.has_msn:
+                msn_constraints = compiled.ad.applicability_rules.msn_constraints
+                if msn_constraints.type == MSNConstraintType.LIST:
+                    # Listed MSNs outside int64 cannot match any fleet MSN here
+                    listed = [msn for msn in compiled.msn_set if _MSN_MIN <= msn <= _MSN_MAX]
+                    live_mask &= np.isin(msns, np.array(listed, dtype=np.int64))
+            gates.append((compiled, model_mask.tolist(), live_mask.tolist()))
+        
+        fleet_results = {}
+        for i, aircraft in enumerate(fleet):
+            snapshot = _snapshot(aircraft)
+            results = {}
+            for compiled, model_mask, live_mask in gates:
+                if live_mask[i]:
+                    results[compiled.ad_id] = self._evaluate(snapshot, compiled, collect_reasons)
+                else:
+                    stage = STAGE_MSN if model_mask[i] else STAGE_MODEL
+                    results[compiled.ad_id] = _make_result(snapshot, compiled, stage, collect_reasons)
+            fleet_results[f"{aircraft.aircraft_model}-{aircraft.msn}"] = results
+        return fleet_results
+    
+    def evaluate_fleet_parallel(self, fleet: List[AircraftConfiguration], workers: Optional[int] = None,
+                                collect_reasons: bool = True) -> Dict[str, Dict[str, ComplianceResult]]:
+        """
+        Evaluate multiple aircraft against all loaded ADs across worker processes
+        
+        The fleet is split into chunks that are evaluated in a process pool.
+        Each worker receives a copy of the engine once. Reasons are assembled
+        in the workers, when results are pickled back to this process.
+        Workers are started with forkserver (or spawn), so a calling script
+        must guard its entry point with ``if __name__ == "__main__":``.
+        
+        Args:
+            workers: Number of worker processes, defaults to os.cpu_count()
+            collect_reasons: If False, the results' reasons are None
+        
+        Returns:
+            Dict mapping aircraft identifier to a dict of compliance results
+            keyed by AD ID, same as evaluate_fleet()
+        """
+        workers = workers or os.cpu_count() or 1
+        chunk_size = max(1, len(fleet) // (workers * 4))
+        chunks = [fleet[i:i + chunk_size] for i in range(0, len(fleet), chunk_size)]
+        
+        # Forked workers can hang the interpreter at exit once Numba's TBB
+        # threads are running in this process, so workers start fresh instead
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        
+        fleet_results = {}
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(start_method),
+                                 initializer=_init_worker, initargs=(self,)) as executor:
+            for chunk_results in executor.map(_eval_chunk, chunks, [collect_reasons] * len(chunks)):
+                fleet_results.update(chunk_results)
         return fleet_results
 
 
-def format_results_table(results: Dict[str, List[ComplianceResult]]) -> str:
+# Engine used by evaluate_fleet_parallel() worker processes
+_worker_engine: Optional[ADComplianceEngine] = None
+
+
+def _init_worker(engine: ADComplianceEngine):
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _eval_chunk(chunk: List[AircraftConfiguration], collect_reasons: bool) -> Dict[str, Dict[str, ComplianceResult]]:
+    """Evaluate a chunk of the fleet in a worker process"""
+    return _worker_engine.evaluate_fleet(chunk, collect_reasons)
+
+
+def format_results_table(results: Dict[str, Dict[str, ComplianceResult]]) -> str:
     """
     Format compliance results as a readable table
     
@@ -234,52 +881,35 @@ def format_results_table(results: Dict[str, List[ComplianceResult]]) -> str:
     # Extract unique AD IDs
     ad_ids = []
     if results:
-        first_results = next(iter(results.values()))
-        ad_ids = [r.ad_id for r in first_results]
+        ad_ids = list(next(iter(results.values())))
     
     # Build table header
     header = ["Aircraft Model", "MSN", "Modifications"] + ad_ids
     
-    # Calculate column widths
-    col_widths = [len(h) for h in header]
-    
     # Build table rows
     rows = []
-    for aircraft_id, compliance_results in results.items():
+    for compliance_results in results.values():
         # Extract aircraft info from first result
-        result = compliance_results[0]
+        result = next(iter(compliance_results.values()))
         
         # Get modifications list (reconstruct from stored data)
         mods_str = "None"
         if hasattr(result, 'modifications') and result.modifications:
             mods_str = ", ".join(result.modifications)
         
-        row = [
-            result.aircraft_model,
-            str(result.msn),
-            mods_str
-        ]
-        
-        # Add compliance status for each AD
-        for r in compliance_results:
-            row.append(r.status)
-        
-        rows.append(row)
-        
-        # Update column widths
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(cell))
+        # Aircraft info followed by the compliance status for each AD
+        rows.append([result.aircraft_model, str(result.msn), mods_str] + [r.status for r in compliance_results.values()])
+    
+    # Calculate column widths and a cell formatter per column, once
+    col_widths = [max(map(len, col)) for col in zip(header, *rows)]
+    formatters = [f" {{:<{w}}} ".format for w in col_widths]
     
     # Format table
     separator = "+" + "+".join(["-" * (w + 2) for w in col_widths]) + "+"
-    header_row = "|" + "|".join([f" {h:<{col_widths[i]}} " for i, h in enumerate(header)]) + "|"
-    
-    table = [separator, header_row, separator]
     
+    table = [separator, "|" + "|".join([fmt(h) for fmt, h in zip(formatters, header)]) + "|", separator]
     for row in rows:
-        row_str = "|" + "|".join([f" {cell:<{col_widths[i]}} " for i, cell in enumerate(row)]) + "|"
-        table.append(row_str)
-    
+        table.append("|" + "|".join([fmt(cell) for fmt, cell in zip(formatters, row)]) + "|")
     table.append(separator)
     
     return "\n".join(table)
@@ -5,8 +5,9 @@ This module defines Pydantic models for representing and validating
 AD applicability rules extracted from regulatory documents.
 """
 
-from typing import List, Optional, Union, Dict, Any
-from pydantic import BaseModel, Field
+import sys
+from typing import List, Optional, Union, Dict, Any, Callable
+from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 
 
@@ -103,6 +104,12 @@ class ApplicabilityRules(BaseModel):
         default_factory=dict,
         description="Additional constraints (flight hours, cycles, dates, etc.)"
     )
+    
+    @field_validator("aircraft_models")
+    @classmethod
+    def _intern_models(cls, v: List[str]) -> List[str]:
+        # Models are compared and hashed against every aircraft's model
+        return [sys.intern(model) for model in v]
 
 
 class AirworthinessDirective(BaseModel):
@@ -122,7 +129,15 @@ class AirworthinessDirective(BaseModel):
         description="Brief summary of what the AD addresses"
     )
     
+    @field_validator("ad_id")
+    @classmethod
+    def _intern_ad_id(cls, v: str) -> str:
+        # AD IDs are used as dict keys for every evaluation
+        return sys.intern(v)
+    
     class Config:
+        # Validators are only needed at parse boundaries; build them on first use
+        defer_build = True
         json_schema_extra = {
             "example": {
                 "ad_id": "FAA-2025-23-53",
@@ -152,7 +167,15 @@ class AircraftConfiguration(BaseModel):
         description="Additional info like flight hours, cycles, etc."
     )
     
+    @field_validator("aircraft_model")
+    @classmethod
+    def _intern_model(cls, v: str) -> str:
+        # Lets model lookups against the interned AD models compare by identity
+        return sys.intern(v)
+    
     class Config:
+        # Validators are only needed at parse boundaries; build them on first use
+        defer_build = True
         json_schema_extra = {
             "example": {
                 "aircraft_model": "A320-214",
@@ -163,16 +186,84 @@ class AircraftConfiguration(BaseModel):
         }
 
 
-class ComplianceResult(BaseModel):
+class ComplianceResult:
     """
     Result of checking an aircraft against an AD
+    
+    Created once per (aircraft, AD) pair, so this is a plain slotted class
+    rather than a Pydantic model. The serialized form is described by
+    ComplianceResultSchema.
+    """
+    __slots__ = ("ad_id", "aircraft_model", "msn", "is_affected", "status", "_reason", "_reason_fn")
+    
+    def __init__(self, ad_id: str, aircraft_model: str, msn: int, is_affected: bool, status: str,
+                 reason: Optional[str] = None, reason_fn: Optional[Callable[[], str]] = None):
+        self.ad_id = ad_id
+        self.aircraft_model = aircraft_model
+        self.msn = msn
+        self.is_affected = is_affected
+        self.status = status
+        # Reason text, or a callable that builds it on first access
+        self._reason = reason
+        self._reason_fn = reason_fn
+    
+    @property
+    def reason(self) -> Optional[str]:
+        """Explanation of why this status was determined, or None if reasons were not collected"""
+        if self._reason is None and self._reason_fn is not None:
+            self._reason = self._reason_fn()
+            self._reason_fn = None
+        return self._reason
+    
+    @reason.setter
+    def reason(self, value: Optional[str]):
+        # Assigned like a field of the former Pydantic model; replaces any deferred reason
+        self._reason = value
+        self._reason_fn = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict matching ComplianceResultSchema"""
+        return {
+            "ad_id": self.ad_id,
+            "aircraft_model": self.aircraft_model,
+            "msn": self.msn,
+            "is_affected": self.is_affected,
+            "status": self.status,
+            "reason": self.reason,
+        }
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # The deferred reason refers to compiled, unpicklable engine state,
+        # so it is built before pickling
+        return self.to_dict()
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(**state)
+    
+    def __eq__(self, other: object) -> bool:
+        # Compares all fields including the reason, like the former Pydantic model
+        if not isinstance(other, ComplianceResult):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+    
+    # Mutable, so unhashable like a Pydantic model
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in self.to_dict().items())
+        return f"{type(self).__name__}({fields})"
+
+
+class ComplianceResultSchema(BaseModel):
+    """
+    Serialized form of a ComplianceResult
     """
     ad_id: str
     aircraft_model: str
     msn: int
     is_affected: bool
     status: str = Field(description="'yes', 'no', or 'not applicable'")
-    reason: str = Field(description="Explanation of why this status was determined")
+    reason: Optional[str] = Field(description="Explanation of why this status was determined")
     
     class Config:
         json_schema_extra = {
@@ -185,4 +276,3 @@ class ComplianceResult(BaseModel):
                 "reason": "Aircraft model MD-11 is in affected models list"
             }
         }
-
@@ -5,8 +5,14 @@ Tests 10 aircraft configurations against FAA AD 2025-23-53 and EASA AD 2025-0254
 """
 
 import json
-from ad_compliance_schema import AircraftConfiguration
-from ad_compliance_engine import ADComplianceEngine, format_results_table
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the standard json module
+    orjson = None
+
+from ad_compliance_engine import ADComplianceEngine, format_results_table, parse_fleet
 
 
 def main():
@@ -20,59 +26,19 @@ def main():
         print(f"  - {ad.ad_id}: {ad.title}")
     print()
     
-    # Define test aircraft fleet
-    test_fleet = [
-        AircraftConfiguration(
-            aircraft_model="MD-11",
-            msn=48123,
-            modifications=[]
-        ),
-        AircraftConfiguration(
-            aircraft_model="DC-10-30F",
-            msn=47890,
-            modifications=[]
-        ),
-        AircraftConfiguration(
-            aircraft_model="Boeing 737-800",
-            msn=30123,
-            modifications=[]
-        ),
-        AircraftConfiguration(
-            aircraft_model="A320-214",
-            msn=5234,
-            modifications=[]
-        ),
-        AircraftConfiguration(
-            aircraft_model="A320-232",
-            msn=6789,
-            modifications=["mod 24591 (production)"]
-        ),
-        AircraftConfiguration(
-            aircraft_model="A320-214",
-            msn=7456,
-            modifications=["SB A320-57-1089 Rev 04"]
-        ),
-        AircraftConfiguration(
-            aircraft_model="A321-111",
-            msn=8123,
-            modifications=[]
-        ),
-        AircraftConfiguration(
-            aircraft_model="A321-112",
-            msn=364,
-            modifications=["mod 24977 (production)"]
-        ),
-        AircraftConfiguration(
-            aircraft_model="A319-100",
-            msn=9234,
-            modifications=[]
-        ),
-        AircraftConfiguration(
-            aircraft_model="MD-10-10F",
-            msn=46234,
-            modifications=[]
-        ),
-    ]
+    # Define test aircraft fleet, validated in one pass
+    test_fleet = parse_fleet([
+        {"aircraft_model": "MD-11", "msn": 48123, "modifications": []},
+        {"aircraft_model": "DC-10-30F", "msn": 47890, "modifications": []},
+        {"aircraft_model": "Boeing 737-800", "msn": 30123, "modifications": []},
+        {"aircraft_model": "A320-214", "msn": 5234, "modifications": []},
+        {"aircraft_model": "A320-232", "msn": 6789, "modifications": ["mod 24591 (production)"]},
+        {"aircraft_model": "A320-214", "msn": 7456, "modifications": ["SB A320-57-1089 Rev 04"]},
+        {"aircraft_model": "A321-111", "msn": 8123, "modifications": []},
+        {"aircraft_model": "A321-112", "msn": 364, "modifications": ["mod 24977 (production)"]},
+        {"aircraft_model": "A319-100", "msn": 9234, "modifications": []},
+        {"aircraft_model": "MD-10-10F", "msn": 46234, "modifications": []},
+    ])
     
     print(f"Testing {len(test_fleet)} aircraft configurations...\n")
     print("=" * 100)
@@ -94,8 +60,8 @@ def main():
         results = fleet_results[aircraft_id]
         
         # Get results for each AD
-        faa_result = next((r for r in results if r.ad_id == "FAA-2025-23-53"), None)
-        easa_result = next((r for r in results if r.ad_id == "EASA-2025-0254"), None)
+        faa_result = results["FAA-2025-23-53"]
+        easa_result = results["EASA-2025-0254"]
         
         mods_str = ", ".join(aircraft.modifications) if aircraft.modifications else "None"
         
@@ -117,7 +83,7 @@ def main():
         print(f"Modifications: {', '.join(aircraft.modifications) if aircraft.modifications else 'None'}")
         print(f"{'=' * 100}")
         
-        for result in results:
+        for result in results.values():
             print(f"\n  AD: {result.ad_id}")
             print(f"  Status: {result.status.upper()}")
             print(f"  Is Affected: {result.is_affected}")
@@ -139,7 +105,7 @@ def main():
             "ad_results": {}
         }
         
-        for result in results:
+        for result in results.values():
             aircraft_result["ad_results"][result.ad_id] = {
                 "status": result.status,
                 "is_affected": result.is_affected,
@@ -148,8 +114,11 @@ def main():
         
         results_export.append(aircraft_result)
     
-    with open("test_results.json", "w") as f:
-        json.dump(results_export, f, indent=2)
+    if orjson is not None:
+        Path("test_results.json").write_bytes(orjson.dumps(results_export, option=orjson.OPT_INDENT_2))
+    else:
+        with open("test_results.json", "w") as f:
+            json.dump(results_export, f, indent=2)
     
     print("Results exported to test_results.json")
     
@@ -158,9 +127,9 @@ def main():
     print("=" * 100)
     
     faa_affected = sum(1 for aircraft in test_fleet 
-                       if fleet_results[f"{aircraft.aircraft_model}-{aircraft.msn}"][0].status == "yes")
+                       if fleet_results[f"{aircraft.aircraft_model}-{aircraft.msn}"]["FAA-2025-23-53"].status == "yes")
     easa_affected = sum(1 for aircraft in test_fleet 
-                        if fleet_results[f"{aircraft.aircraft_model}-{aircraft.msn}"][1].status == "yes")
+                        if fleet_results[f"{aircraft.aircraft_model}-{aircraft.msn}"]["EASA-2025-0254"].status == "yes")
     
     print(f"FAA AD 2025-23-53:")
     print(f"  - Affected: {faa_affected}/{len(test_fleet)} aircraft")
@@ -168,8 +137,8 @@ def main():
     
     print(f"\nEASA AD 2025-0254:")
     print(f"  - Affected: {easa_affected}/{len(test_fleet)} aircraft")
-    print(f"  - Excluded by modifications: {sum(1 for aircraft in test_fleet if fleet_results[f'{aircraft.aircraft_model}-{aircraft.msn}'][1].status == 'no')}")
-    print(f"  - Not Applicable: {sum(1 for aircraft in test_fleet if fleet_results[f'{aircraft.aircraft_model}-{aircraft.msn}'][1].status == 'not applicable')}/{len(test_fleet)} aircraft")
+    print(f"  - Excluded by modifications: {sum(1 for aircraft in test_fleet if fleet_results[f'{aircraft.aircraft_model}-{aircraft.msn}']['EASA-2025-0254'].status == 'no')}")
+    print(f"  - Not Applicable: {sum(1 for aircraft in test_fleet if fleet_results[f'{aircraft.aircraft_model}-{aircraft.msn}']['EASA-2025-0254'].status == 'not applicable')}/{len(test_fleet)} aircraft")
     
     print("\n" + "=" * 100)
 
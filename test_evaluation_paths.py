@@ -0,0 +1,159 @@
+"""
+Equivalence Check for the Fleet Evaluation Paths
+
+Evaluates a randomized fleet against the repo's ADs plus synthetic ADs
+covering MSN ranges and lists and required modifications, and checks that
+evaluate_fleet_vectorized() and evaluate_fleet_parallel() return the same
+statuses and reasons as evaluate_fleet(), also after a pickle round trip.
+The comparison, except for evaluate_fleet_parallel(), is repeated with the
+pyahocorasick, NumPy and Numba fallbacks forced.
+"""
+
+import json
+import pickle
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+import _msn_gate
+import ad_compliance_engine
+from ad_compliance_engine import ADComplianceEngine, parse_fleet
+
+
+# Synthetic ADs exercising the constraint types the repo's ADs leave out
+EXTRA_RULES = [
+    {
+        "ad_id": "TEST-RANGE",
+        "issuing_authority": "TEST",
+        "applicability_rules": {
+            "aircraft_models": ["A320-214", "A321-111", "MD-11"],
+            "msn_constraints": {"type": "range", "min_msn": 1000, "max_msn": 6000},
+            "required_modifications": [
+                {"mod_id": "SB A320-57-1089", "aliases": ["A320-57-1089"]},
+                {"mod_id": "mod 24977", "aliases": ["24977"]}
+            ]
+        }
+    },
+    {
+        "ad_id": "TEST-OPEN-RANGE",
+        "issuing_authority": "TEST",
+        "applicability_rules": {
+            "aircraft_models": ["A320-232", "DC-10-30F"],
+            "msn_constraints": {"type": "range", "min_msn": 5000},
+            "excluded_if_modifications": [{"mod_id": "mod 24591", "aliases": ["24591"]}]
+        }
+    },
+    {
+        "ad_id": "TEST-LIST",
+        "issuing_authority": "TEST",
+        "applicability_rules": {
+            "aircraft_models": ["A320-214", "A320-232", "MD-10-10F"],
+            "msn_constraints": {"type": "list", "msn_list": [364, 5234, 6789, 46234]}
+        }
+    }
+]
+
+MODELS = ["MD-11", "DC-10-30F", "MD-10-10F", "Boeing 737-800", "A319-100",
+          "A320-214", "A320-232", "A321-111", "A321-112"]
+MODIFICATIONS = ["mod 24591 (production)", "SB A320-57-1089 Rev 04", "MOD24977", "sb a320-57-1089",
+                 "Modification 24591", "SB A320-32-1001", "  A320-57-1089 rev 2  "]
+
+
+def random_fleet(size: int, seed: int = 0) -> list:
+    """Build a fleet with unique MSNs, so every aircraft has its own identifier"""
+    rng = random.Random(seed)
+    msns = rng.sample(range(1, 50000), size - 4) + [364, 5234, 6789, 46234]
+    return parse_fleet([
+        {
+            "aircraft_model": rng.choice(MODELS),
+            "msn": msn,
+            "modifications": rng.sample(MODIFICATIONS, rng.randint(0, 2)),
+        }
+        for msn in msns
+    ])
+
+
+def as_rows(results: list) -> list:
+    """[(ad_id, status, is_affected, reason), ...] in AD order"""
+    return [(r.ad_id, r.status, r.is_affected, r.reason) for r in results]
+
+
+def flatten(fleet_results: dict) -> dict:
+    """Aircraft identifier -> rows of its results, see as_rows()"""
+    return {aircraft_id: as_rows(results.values()) for aircraft_id, results in fleet_results.items()}
+
+
+def compare(label: str, expected: dict, actual: dict) -> bool:
+    mismatches = [aircraft_id for aircraft_id in expected if actual.get(aircraft_id) != expected[aircraft_id]]
+    if set(actual) != set(expected) or mismatches:
+        print(f"  {label}: MISMATCH for {len(mismatches)} aircraft, e.g. {mismatches[:3]}")
+        return False
+    print(f"  {label}: OK")
+    return True
+
+
+def check_paths(rules_path: str, fleet: list, label: str, parallel: bool = True) -> bool:
+    """
+    Compare the fleet evaluation paths against evaluate_fleet() for one engine setup
+    
+    Args:
+        parallel: Also compare evaluate_fleet_parallel(); its workers import
+            the engine afresh, so they never see fallbacks forced here
+    """
+    print(label)
+    engine = ADComplianceEngine(rules_path)
+    expected = flatten(engine.evaluate_fleet(fleet))
+    
+    ok = compare("evaluate_fleet_vectorized", expected, flatten(engine.evaluate_fleet_vectorized(fleet)))
+    ok &= compare("evaluate_fleet_vectorized, Python error model", expected,
+                  flatten(engine.evaluate_fleet_vectorized(fleet, error_model="python")))
+    if parallel:
+        ok &= compare("evaluate_fleet_parallel", expected, flatten(engine.evaluate_fleet_parallel(fleet, workers=2)))
+    # Results whose reasons have not been read yet must survive pickling
+    ok &= compare("pickle round trip", expected, flatten(pickle.loads(pickle.dumps(engine.evaluate_fleet(fleet)))))
+    ok &= compare("evaluate_all", expected, {
+        f"{aircraft.aircraft_model}-{aircraft.msn}": as_rows(engine.evaluate_all(aircraft)) for aircraft in fleet
+    })
+    return ok
+
+
+def main():
+    """Run the fleet evaluation paths against each other with and without the optional accelerators"""
+    rules = json.loads(Path("ad_rules.json").read_text()) + EXTRA_RULES
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        json.dump(rules, f)
+    rules_path = f.name
+    
+    fleet = random_fleet(500)
+    reference = flatten(ADComplianceEngine(rules_path).evaluate_fleet(fleet))
+    
+    ok = check_paths(rules_path, fleet, "All available accelerators")
+    
+    # The same comparisons with each optional dependency unavailable; the
+    # engine reads these module globals when compiling and indexing ADs.
+    # Worker processes would not inherit the override, so the parallel path
+    # is only compared above
+    fallbacks = [
+        (ad_compliance_engine, "ahocorasick", "Without pyahocorasick"),
+        (_msn_gate, "njit", "Without Numba"),
+        (ad_compliance_engine, "np", "Without NumPy"),
+    ]
+    for module, name, label in fallbacks:
+        saved = getattr(module, name)
+        setattr(module, name, None)
+        try:
+            ok &= check_paths(rules_path, fleet, label, parallel=False)
+            ok &= compare("evaluate_fleet against the accelerated engine", reference,
+                          flatten(ADComplianceEngine(rules_path).evaluate_fleet(fleet)))
+        finally:
+            setattr(module, name, saved)
+    
+    Path(rules_path).unlink()
+    
+    print("\nAll evaluation paths agree" if ok else "\nEvaluation paths disagree")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()